@@ -1,10 +1,150 @@
 import argparse
+import mmap
+import warnings
+from array import array
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 from paperfig.figure import Fig
 
+matplotlib.use("Agg")
+
 FIG_DIR = "fig"
+MAX_POINTS = 20000  # scatter points drawn per figure
+
+_CANVAS = None
+
+
+def _canvas():
+    """Returns the shared Figure/Axes, cleared for the next plot."""
+    global _CANVAS
+    if _CANVAS is None:
+        _CANVAS = plt.subplots(figsize=(4.0, 3.0))
+    fig, ax = _CANVAS
+    ax.clear()
+    ax.set_aspect("auto", adjustable="box")  # clear() keeps axis("equal")
+    return fig, ax
+
+
+def _downsample(x, y, index, verbose):
+    """Randomly thins points to MAX_POINTS; more can't be resolved at 200 dpi."""
+    if x.size <= MAX_POINTS:
+        return x, y
+    if verbose > 0:
+        warnings.warn(f"Figure {index}: plotting {MAX_POINTS} of {x.size} points",
+                      stacklevel=2)
+    idx = np.random.default_rng(0).choice(x.size, MAX_POINTS, replace=False)
+    idx.sort()
+    return x[idx], y[idx]
+
+
+# NumPy 1.23 以降の loadtxt は C 実装
+_HAS_C_LOADTXT = np.lib.NumpyVersion(np.__version__) >= "1.23.0"
+
+
+def _load_columns(path, delim, x_col, y_col):
+    """Reads the x/y columns of a CSV file into an (n, 2) float array.
+
+    Raises IndexError when a column index is out of bounds.
+    """
+    try:
+        if _HAS_C_LOADTXT:
+            return np.loadtxt(path, delimiter=delim, dtype=np.float64,
+                              usecols=(x_col, y_col), ndmin=2)
+        import pandas as pd
+        cols = sorted({x_col, y_col})
+        df = pd.read_csv(path, sep=delim, header=None, dtype=np.float64,
+                         engine="c", usecols=cols, na_filter=False)
+        arr = df.to_numpy()
+        return arr[:, [cols.index(x_col), cols.index(y_col)]]
+    except ValueError:
+        pass
+    # ヘッダ行や空欄がある場合は genfromtxt で読み、解釈できないセルは NaN にする
+    arr = np.genfromtxt(path, delimiter=delim, dtype=float)
+    if arr.ndim == 1:
+        arr = arr.reshape(-1, 1)
+    if x_col >= arr.shape[1] or y_col >= arr.shape[1]:
+        raise IndexError("column index out of bounds")
+    return arr[:, [x_col, y_col]]
+
+
+def _to_float(cell):
+    try:
+        return float(cell)
+    except ValueError:
+        return np.nan  # same as genfromtxt for headers / empty cells
+
+
+def _stream_two_cols(path, delim, x_col, y_col, x_max=None, x_sorted=False):
+    """Scans a memory-mapped CSV line by line, keeping only the x/y columns.
+
+    Memory stays proportional to the kept points rather than the file size.
+    Unparsable cells become NaN, as in ``_load_columns``. With ``x_sorted``
+    parsing stops at the first row whose x exceeds x_max; the remaining lines
+    are only counted. Returns ``(x, y, rows)`` where rows counts all data
+    lines in the file, as on the non-streaming path.
+    """
+    xs = array("d")
+    ys = array("d")
+    rows = 0
+    sep = delim.encode() if delim is not None else None  # None: any whitespace
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return np.empty(0), np.empty(0), 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = iter(mm.readline, b"")
+            for line in lines:
+                line = line.split(b"#", 1)[0].strip()  # drop comments like loadtxt
+                if not line:
+                    continue
+                rows += 1
+                fields = line.split(sep)
+                if x_col >= len(fields) or y_col >= len(fields):
+                    raise IndexError(f"column index out of bounds at row {rows}")
+                x = _to_float(fields[x_col])
+                if x_max is not None and not x <= x_max:  # NaN is dropped too
+                    if x_sorted and x > x_max:
+                        break
+                    continue
+                xs.append(x)
+                ys.append(_to_float(fields[y_col]))
+            for line in lines:
+                if line.split(b"#", 1)[0].strip():
+                    rows += 1
+    return np.frombuffer(xs, dtype=np.float64), np.frombuffer(ys, dtype=np.float64), rows
+
+
+@lru_cache(maxsize=32)
+def _load_xy(path_str, mtime_ns, delim, x_col, y_col, x_max, stream=False, x_sorted=False):
+    """Parses and filters the x/y columns; cached while the file is unchanged.
+
+    Returns read-only arrays ``(x, y)`` and the number of data rows in the file.
+    """
+    if stream:
+        x, y, rows = _stream_two_cols(path_str, delim, x_col, y_col, x_max, x_sorted)
+    else:
+        arr = _load_columns(path_str, delim, x_col, y_col)
+        x = arr[:, 0]
+        y = arr[:, 1]
+        rows = int(arr.shape[0])
+        if x_max is not None:
+            mask = x <= x_max
+            x, y = x[mask], y[mask]
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y, rows
+
+
+@lru_cache(maxsize=32)
+def _sort_order(*key):
+    """Returns the cached ``argsort`` of x for the same key as ``_load_xy``."""
+    x = _load_xy(*key)[0]
+    order = np.argsort(x)
+    order.setflags(write=False)
+    return order
+
 
 def make_csv_plot_renderer(json_dir: Path):
     """Returns a renderer that plots CSV data as points (optionally with a line)."""
@@ -24,31 +164,34 @@ def make_csv_plot_renderer(json_dir: Path):
         x_col = int(cfg.get("x_col", 0))
         y_col = int(cfg.get("y_col", 1))
         x_max = cfg.get("x_max", None)
+        x_max = float(x_max) if x_max is not None else None
         style = str(cfg.get("style", "points")).lower()  # "points" | "line" | "both"
         s = float(cfg.get("marker_size", 18.0))
         alpha = float(cfg.get("alpha", 0.8))
         lw = float(cfg.get("line_width", 1.2))
-
-        arr = np.genfromtxt(path, delimiter=delim, dtype=float)
-        if arr.ndim == 1:
-            arr = arr.reshape(-1, 1)
-        if x_col >= arr.shape[1] or y_col >= arr.shape[1]:
-            raise RuntimeError(f"Figure {index}: column index out of bounds")
-
-        x = arr[:, x_col]
-        y = arr[:, y_col]
-        if x_max is not None:
-            mask = x <= float(x_max)
-            x, y = x[mask], y[mask]
+        stream = bool(cfg.get("stream", False))  # 巨大な CSV 向けの逐次読み込み
+        x_sorted = bool(cfg.get("x_sorted", False))
+
+        # 必要な列だけを C パーサで読み込む（ファイルが変わらなければキャッシュ）
+        key = (str(path), path.stat().st_mtime_ns, delim, x_col, y_col, x_max,
+               stream, x_sorted)
+        try:
+            x, y, rows = _load_xy(*key)
+        except IndexError as e:
+            raise RuntimeError(f"Figure {index}: column index out of bounds") from e
+        except ValueError as e:
+            raise RuntimeError(f"Figure {index}: cannot parse {path}: {e}") from e
 
         # 散布図（デフォルト）
-        fig, ax = plt.subplots(figsize=(4.0, 3.0))
+        fig, ax = _canvas()
         if style in ("points", "both"):
-            ax.scatter(x, y, s=s, alpha=alpha, edgecolor="none")
+            px, py = _downsample(x, y, index, verbose)
+            ax.scatter(px, py, s=s, alpha=alpha, edgecolor="none",
+                       rasterized=True)
 
         # 線（必要なら重ねる）
         if style in ("line", "both"):
-            order = np.argsort(x)
+            order = _sort_order(*key)
             ax.plot(x[order], y[order], lw=lw, color="#444444")
 
         ax.set_xlabel(f"col {x_col}")
@@ -57,14 +200,14 @@ def make_csv_plot_renderer(json_dir: Path):
         ax.grid(True, ls=":", alpha=0.5)
 
         # 保存
-        plt.savefig(f"{FIG_DIR}/fig{index}.pdf")
-        plt.close(fig)
+        fig.savefig(f"{FIG_DIR}/fig{index}.pdf", dpi=200,
+                    metadata={"CreationDate": None})
 
         # メタデータ
         return {
             "data_file": str(path),
             "columns": {"x": x_col, "y": y_col},
-            "rows": int(arr.shape[0]),
+            "rows": rows,
             "style": style,
         }
     return csv_plot
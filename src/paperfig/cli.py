@@ -10,6 +10,7 @@ def cmd_build(args: argparse.Namespace) -> int:
     fig.fig_dir = args.outdir
     fig.pdf_filename = args.output
     fig.verbose = args.verbose
+    fig.jobs = args.jobs
     try:
         fig.create_pdf()
     except FigError as e:
@@ -53,6 +54,8 @@ def main(argv: list[str] | None = None) -> None:
                          help="Output directory")
     p_build.add_argument("-v", "--verbose", type=int,
                          default=1, help="Verbosity (0/1/2)")
+    p_build.add_argument("-j", "--jobs", type=int, default=1,
+                         help="Number of figures to render in parallel")
     p_build.set_defaults(func=cmd_build)
 
     p_val = sub.add_parser("validate", help="Validate JSON spec only")
@@ -14,34 +14,136 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, ClassVar, Dict, Optional
 
 import importlib
 import importlib.metadata
 
 from pdfgridcat import concat_pdf_pages
+from pypdf import PdfWriter
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is used otherwise
+    orjson = None
 
 
 Renderer = Callable[[str, Dict[str, Any], Any], Any]
 
+_REQUIRED_MULTI = ("row", "column")
+
 
 class FigError(Exception):
     """Domain-specific errors for figure orchestration."""
 
 
+def _walk_floats(obj: Any):
+    if type(obj) is float:
+        yield obj
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            yield from _walk_floats(v)
+    elif isinstance(obj, (list, tuple)):
+        for v in obj:
+            yield from _walk_floats(v)
+
+
+def _has_wide_int_float(obj: Any) -> bool:
+    # orjson may decode integers beyond 64 bits as lossy floats; an integral
+    # float that large is treated as such and re-parsed by the stdlib.
+    return any(abs(v) >= 2.0 ** 63 and v.is_integer() for v in _walk_floats(obj))
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            obj = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which the stdlib accepts
+        else:
+            if not _has_wide_int_float(obj):
+                return obj
+    return json.loads(raw)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    # orjson would write NaN/Infinity as null and rejects ints beyond 64 bits;
+    # use the stdlib for those. Otherwise output differs only in number
+    # spelling (1e20 vs 1e+20).
+    if orjson is not None and not any(
+            not math.isfinite(v) for v in _walk_floats(obj)):
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _render_worker(renderer: Renderer, index: str, data: Dict[str, Any],
+                   verbose: int) -> Any:
+    return renderer(index, data, verbose=verbose)
+
+
+def _append_pdf_pages(input_files: list[str], output_file: str) -> None:
+    """Append the first page of each input as-is (no grid re-layout)."""
+    writer = PdfWriter()
+    for path in input_files:
+        writer.append(path, pages=(0, 1))
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    with open(output_file, "wb") as f:
+        writer.write(f)
+
+
+def _concat(input_files: list[str], output_file: str, col: int, row: int) -> None:
+    if col == 1 and row == 1:
+        _append_pdf_pages(input_files, output_file)
+    else:
+        concat_pdf_pages(
+            input_files=input_files,
+            output_file=output_file,
+            col=col,
+            row=row,
+        )
+
+
+class _Deferred:
+    """Future-like wrapper that runs the renderer in-process on result()."""
+
+    def __init__(self, renderer: Renderer, index: str, data: Dict[str, Any],
+                 verbose: int, announce: Callable[[], None]):
+        self._call = (renderer, index, data, verbose)
+        self._announce = announce
+
+    def result(self) -> Any:
+        self._announce()
+        return _render_worker(*self._call)
+
+
 class Fig:
     """Container and runner for figure creation based on a JSON specification."""
 
+    # Installed entry points do not change within a process; scan them once.
+    _entry_point_renderers: ClassVar[Optional[Dict[str, Renderer]]] = None
+
     def __init__(self, json_filename: str | Path):
         self._json_filename: Path = Path(json_filename).expanduser()
         self.pdf_filename: str = "figures.pdf"
         self.verbose: int = 1
+        self.jobs: int = 1
         self._fig_dir: Path = Path(".")
         self.function: Dict[str, Renderer] = {}
         self.result: Dict[str, Any] = {}
         self._logger = self._make_logger()
-        self._entry_point_renderers: Optional[Dict[str, Renderer]] = None
+        self._resolved: Dict[str, Renderer] = {}
+        self._outputs: set[str] = set()
         self.load_json()
 
     @property
@@ -51,6 +153,9 @@ class Fig:
     @fig_dir.setter
     def fig_dir(self, value: Any) -> None:
         if isinstance(value, Path):
+            if not str(value).startswith("~"):
+                self._fig_dir = value
+                return
             self._fig_dir = value.expanduser()
         else:
             self._fig_dir = Path(str(value)).expanduser()
@@ -82,64 +187,68 @@ class Fig:
         if not self.json_filename.exists():
             raise FigError(f"JSON file does not exist: {self.json_filename}")
         try:
-            with self.json_filename.open(encoding="utf-8") as f:
-                self.list: Dict[str, Dict[str, Any]] = json.load(f)
-        except json.JSONDecodeError as e:
+            self.list: Dict[str, Dict[str, Any]] = _json_loads(
+                self.json_filename.read_bytes())
+        except json.JSONDecodeError as e:  # also raised by orjson
             raise FigError(
                 f"Failed to parse JSON: {self.json_filename}: {e}") from e
         self._validate_json()
 
     def save_json(self) -> None:
         try:
-            json.dumps(self.list)
-        except OSError as e:
+            payload = _json_dumps(self.list)
+        except (TypeError, ValueError) as e:
             raise FigError(
                 f"Failed to convert JSON: {self.list}: {e}") from e
         try:
-            with self.json_filename.open("w", encoding="utf-8") as f:
-                json.dump(self.list, f, indent=2, ensure_ascii=False)
+            self.json_filename.write_bytes(payload)
         except OSError as e:
             raise FigError(
                 f"Failed to write JSON: {self.json_filename}: {e}") from e
 
     def _validate_json(self) -> None:
-        if not isinstance(self.list, dict):
+        # The spec comes straight from a JSON decoder, so exact type checks
+        # suffice; locals avoid repeated global lookups on large specs.
+        _dict = dict
+        _str = str
+        spec = self.list
+        if type(spec) is not _dict:
             raise FigError(
                 "Root of JSON must be an object mapping id -> figure spec.")
-        for idx, node in self.list.items():
-            if not isinstance(idx, str):
+        for idx, node in spec.items():
+            if type(idx) is not _str:
                 raise FigError(f"Figure id must be a string, got: {idx!r}")
-            if not isinstance(node, dict):
+            if type(node) is not _dict:
                 raise FigError(f"Figure '{idx}' spec must be an object.")
             t = node.get("type")
-            if not isinstance(t, str):
+            if type(t) is not _str:
                 raise FigError(
                     f"Figure '{idx}' must have a string 'type' field.")
-            if t == "multi":
-                figs = node.get("figures")
-                if not isinstance(figs, dict):
+            if t != "multi":
+                continue
+            figs = node.get("figures")
+            if type(figs) is not _dict:
+                raise FigError(
+                    f"Figure '{idx}': multi requires 'figures' object.")
+            for k, sub in figs.items():
+                if type(sub) is not _dict:
                     raise FigError(
-                        f"Figure '{idx}': multi requires 'figures' object.")
-                for k, sub in figs.items():
-                    if not isinstance(sub, dict):
-                        raise FigError(
-                            f"Figure '{idx}': sub-figure '{k}' must be object.")
-                    st = sub.get("type")
-                    if not isinstance(st, str):
-                        raise FigError(
-                            f"Figure '{idx}': sub-figure '{k}' must have string 'type'."
-                        )
-                for key in ("row", "column"):
-                    if key not in node:
-                        raise FigError(
-                            f"Figure '{idx}': multi requires '{key}'.")
+                        f"Figure '{idx}': sub-figure '{k}' must be object.")
+                if type(sub.get("type")) is not _str:
+                    raise FigError(
+                        f"Figure '{idx}': sub-figure '{k}' must have string 'type'."
+                    )
+            for key in _REQUIRED_MULTI:
+                if key not in node:
+                    raise FigError(
+                        f"Figure '{idx}': multi requires '{key}'.")
 
     def register(self, type_name: str, renderer: Renderer) -> None:
         self.function[type_name] = renderer
 
     def _load_entry_point_renderers(self) -> Dict[str, Renderer]:
-        if self._entry_point_renderers is not None:
-            return self._entry_point_renderers
+        if Fig._entry_point_renderers is not None:
+            return Fig._entry_point_renderers
         eps: Dict[str, Renderer] = {}
         try:
             for ep in importlib.metadata.entry_points(group="paperfig.renderers"):
@@ -151,14 +260,17 @@ class Fig:
                     continue
         except Exception:
             pass
-        self._entry_point_renderers = eps
+        Fig._entry_point_renderers = eps
         return eps
 
     def _resolve_renderer(self, type_name: str) -> Optional[Renderer]:
         if type_name in self.function:
             return self.function[type_name]
+        if type_name in self._resolved:
+            return self._resolved[type_name]
         eps = self._load_entry_point_renderers()
         if type_name in eps:
+            self._resolved[type_name] = eps[type_name]
             return eps[type_name]
         if ":" in type_name:
             mod_name, func_name = type_name.split(":", 1)
@@ -166,61 +278,138 @@ class Fig:
                 mod = importlib.import_module(mod_name)
                 func = getattr(mod, func_name)
                 if callable(func):
+                    self._resolved[type_name] = func
                     return func
             except Exception as e:
                 raise FigError(
                     f"Failed to import renderer '{type_name}': {e}") from e
         return None
 
+    def _executor(self):
+        if self.jobs > 1:
+            return ProcessPoolExecutor(max_workers=self.jobs)
+        return nullcontext()
+
+    def _submit(self, executor: Optional[ProcessPoolExecutor], renderer: Renderer,
+                index: str, data: Dict[str, Any], what: str, *args: Any) -> Any:
+        # In-process jobs log "Rendering ..." when result() runs them. Pool
+        # jobs start whenever a worker is free, so they log "Rendered ..."
+        # from a done-callback once the worker has finished.
+        if executor is not None:
+            try:
+                pickle.dumps(renderer)
+            except Exception:
+                # Closures/lambdas cannot cross process boundaries.
+                pass
+            else:
+                future = executor.submit(
+                    _render_worker, renderer, index, data, self.verbose)
+
+                def done(f: Any) -> None:
+                    if not f.cancelled() and f.exception() is None:
+                        self._logger.info("Rendered " + what, *args)
+
+                future.add_done_callback(done)
+                return future
+        announce = partial(self._logger.info, "Rendering " + what, *args)
+        return _Deferred(renderer, index, data, self.verbose, announce)
+
+    def _submit_multi(self, executor: Optional[ProcessPoolExecutor],
+                      parent_index: str, fig: Dict[str, Any]) -> Dict[str, Any]:
+        figs = fig.get("figures")
+        if not isinstance(figs, dict):
+            raise FigError(
+                f"Figure '{parent_index}': multi requires 'figures' object.")
+        if not isinstance(fig.get("row"), int) or not isinstance(fig.get("column"), int):
+            raise FigError(
+                f"Figure '{parent_index}': 'row' and 'column' must be integers.")
+        pending: Dict[str, Any] = {}
+        for index, data in figs.items():
+            t = data.get("type")
+            if not isinstance(t, str):
+                raise FigError(
+                    f"Figure '{parent_index}': sub-figure '{index}' has invalid 'type'.")
+            renderer = self._resolve_renderer(t)
+            if renderer is None:
+                raise FigError(
+                    f"type '{t}' not defined in multi() for '{index}'")
+            pending[index] = self._submit(
+                executor, renderer, index, data,
+                "sub-figure %s (type=%s) of %s", index, t, parent_index)
+        return pending
+
+    def _output_exists(self, name: str) -> bool:
+        if name in self._outputs:
+            return True
+        # New files (e.g. in a fresh fig_dir) cost one stat each, as before.
+        if os.path.exists(os.path.join(self.fig_dir, name)):
+            self._outputs.add(name)
+            return True
+        return False
+
     def create_pdf(self, index=None) -> None:
         index_argument = index
         self._apply_verbose()
-        self.fig_dir = self.fig_dir  # normalize
         try:
             self.fig_dir.mkdir(parents=True, exist_ok=True)
         except OSError as e:
             raise FigError(
                 f"Cannot create output directory: {self.fig_dir}: {e}") from e
+        self._outputs = {e.name for e in os.scandir(self.fig_dir)}
 
         self.result = {}
-        fig_files: list[Path] = []
+        fig_dir = os.fspath(self.fig_dir)
+        fig_files: list[str] = []
+
+        with self._executor() as executor:
+            # Submit every leaf renderer first so independent figures can run
+            # concurrently, then collect results in spec order.
+            pending: Dict[str, Any] = {}
+            for index, data in self.list.items():
+                if index_argument and index_argument != index:
+                    continue
+                t = data.get("type")
+                if not isinstance(t, str):
+                    raise FigError(
+                        f"Figure '{index}' has invalid 'type': {t!r}")
+                if t == "multi":
+                    pending[index] = self._submit_multi(executor, index, data)
+                    continue
 
-        for index, data in self.list.items():
-            if index_argument and index_argument != index:
-                continue
-            t = data.get("type")
-            if not isinstance(t, str):
-                raise FigError(f"Figure '{index}' has invalid 'type': {t!r}")
-            if t == "multi":
-                result_multi = self.multi(index, data)
-                for k, v in result_multi.items():
-                    self.result[k] = v
-                parent_pdf = self.fig_dir / f"fig{index}.pdf"
-                if not parent_pdf.exists():
+                renderer = self._resolve_renderer(t)
+                if renderer is None:
                     raise FigError(
-                        f"Composite PDF not produced for '{index}': {parent_pdf}"
-                    )
-                fig_files.append(parent_pdf)
-                continue
+                        f"type '{t}' not defined/resolvable for figure '{index}'")
 
-            renderer = self._resolve_renderer(t)
-            if renderer is None:
-                raise FigError(
-                    f"type '{t}' not defined/resolvable for figure '{index}'")
+                pending[index] = self._submit(
+                    executor, renderer, index, data,
+                    "%s (type=%s)", index, t)
 
-            self._logger.info(f"Rendering {index} (type={t})")
-            try:
-                self.result[index] = renderer(
-                    index, data, verbose=self.verbose)
-            except TypeError:
-                raise
+            for index, data in self.list.items():
+                if index not in pending:
+                    continue
+                if data.get("type") == "multi":
+                    result_multi = self.multi(index, data, pending[index])
+                    for k, v in result_multi.items():
+                        self.result[k] = v
+                    name = f"fig{index}.pdf"
+                    parent_pdf = os.path.join(fig_dir, name)
+                    if not self._output_exists(name):
+                        raise FigError(
+                            f"Composite PDF not produced for '{index}': {parent_pdf}"
+                        )
+                    fig_files.append(parent_pdf)
+                    continue
 
-            expected = self.fig_dir / f"fig{index}.pdf"
-            if not expected.exists():
-                raise FigError(
-                    f"Renderer completed but expected file not found: {expected}"
-                )
-            fig_files.append(expected)
+                self.result[index] = pending[index].result()
+
+                name = f"fig{index}.pdf"
+                expected = os.path.join(fig_dir, name)
+                if not self._output_exists(name):
+                    raise FigError(
+                        f"Renderer completed but expected file not found: {expected}"
+                    )
+                fig_files.append(expected)
 
         if not fig_files:
             raise FigError("No figures were produced; nothing to concatenate.")
@@ -228,67 +417,44 @@ class Fig:
         out_file = self.fig_dir / self.pdf_filename
         if index_argument:
             if self.verbose > 0:
-                self._logger.info(f"Finished creating fig{index_argument}.pdf")
+                self._logger.info("Finished creating fig%s.pdf", index_argument)
             return
 
         self._logger.info(
-            f"Concatenating {len(fig_files)} pages -> {out_file}")
+            "Concatenating %d pages -> %s", len(fig_files), out_file)
         try:
-            concat_pdf_pages(
-                input_files=[str(p) for p in fig_files],
-                output_file=str(out_file),
-                col=1,
-                row=1,
-            )
+            _concat(fig_files, os.fspath(out_file), col=1, row=1)
         except Exception as e:
             raise FigError(f"Concatenation failed: {e}") from e
 
         if self.verbose > 0:
-            self._logger.info(f"Finished creating {out_file}")
+            self._logger.info("Finished creating %s", out_file)
 
-    def multi(self, parent_index: str, fig: Dict[str, Any]) -> Dict[str, Any]:
-        figs = fig.get("figures")
-        if not isinstance(figs, dict):
-            raise FigError(
-                f"Figure '{parent_index}': multi requires 'figures' object.")
-        row = fig.get("row")
-        col = fig.get("column")
-        if not isinstance(row, int) or not isinstance(col, int):
-            raise FigError(
-                f"Figure '{parent_index}': 'row' and 'column' must be integers.")
+    def multi(self, parent_index: str, fig: Dict[str, Any],
+              pending: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if pending is None:
+            pending = self._submit_multi(None, parent_index, fig)
+        row = fig["row"]
+        col = fig["column"]
 
         result: Dict[str, Any] = {}
-        fig_files: list[Path] = []
+        fig_dir = os.fspath(self.fig_dir)
+        fig_files: list[str] = []
 
-        for index, data in figs.items():
-            t = data.get("type")
-            if not isinstance(t, str):
-                raise FigError(
-                    f"Figure '{parent_index}': sub-figure '{index}' has invalid 'type'.")
-            renderer = self._resolve_renderer(t)
-            if renderer is None:
-                raise FigError(
-                    f"type '{t}' not defined in multi() for '{index}'")
-            self._logger.info(
-                f"Rendering sub-figure {index} (type={t}) of {parent_index}")
-            res = renderer(index, data, verbose=self.verbose)
-            result[index] = res
+        for index, job in pending.items():
+            result[index] = job.result()
 
-            expected = self.fig_dir / f"fig{index}.pdf"
-            if not expected.exists():
+            name = f"fig{index}.pdf"
+            expected = os.path.join(fig_dir, name)
+            if not self._output_exists(name):
                 raise FigError(
                     f"Sub-figure renderer completed but expected file not found: {expected}"
                 )
             fig_files.append(expected)
 
-        output_file = self.fig_dir / f"fig{parent_index}.pdf"
+        output_file = os.path.join(fig_dir, f"fig{parent_index}.pdf")
         try:
-            concat_pdf_pages(
-                input_files=[str(p) for p in fig_files],
-                output_file=str(output_file),
-                col=col,
-                row=row,
-            )
+            _concat(fig_files, output_file, col=col, row=row)
         except Exception as e:
             raise FigError(
                 f"Concatenation for multi '{parent_index}' failed: {e}") from e
@@ -34,7 +34,8 @@ def test_cmd_build(mock_fig_cls, cli_json_file):
         json_file=cli_json_file,
         outdir="out",
         output="final.pdf",
-        verbose=1
+        verbose=1,
+        jobs=1
     )
     
     # Run
@@ -46,6 +47,7 @@ def test_cmd_build(mock_fig_cls, cli_json_file):
     assert mock_instance.fig_dir == "out"
     assert mock_instance.pdf_filename == "final.pdf"
     assert mock_instance.verbose == 1
+    assert mock_instance.jobs == 1
     mock_instance.create_pdf.assert_called_once()
 
 
@@ -56,7 +58,7 @@ def test_cmd_build_error(mock_fig_cls, cli_json_file):
     mock_instance.create_pdf.side_effect = FigError("Build failed")
     
     args = argparse.Namespace(
-        json_file=cli_json_file, outdir="out", output="f.pdf", verbose=1
+        json_file=cli_json_file, outdir="out", output="f.pdf", verbose=1, jobs=1
     )
     
     ret = cmd_build(args)
@@ -0,0 +1,65 @@
+"""Tests for helpers in the bundled example scripts (docs/examples)."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("matplotlib")
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "docs" / "examples"
+
+
+def load_example(filename, module_name):
+    """Import an example script as a module (registered for numba's cache)."""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, EXAMPLES / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def fig_data():
+    return load_example("fig-data.py", "example_fig_data")
+
+
+@pytest.mark.parametrize("delim, text", [
+    (",", "# header comment\nx,y\n1,2\n3,\n\n5,6 # note\n7,8\n"),
+    (None, "1 2\n3   4 # note\n\t5 6\n"),
+])
+def test_stream_matches_default_reader(fig_data, tmp_path, delim, text):
+    """Test the streaming reader gives the same points/rows as the default."""
+    path = tmp_path / "data.csv"
+    path.write_text(text, encoding="utf-8")
+    for x_max in (None, 4.0):
+        default = fig_data._load_xy(str(path), 0, delim, 0, 1, x_max)
+        stream = fig_data._load_xy(str(path), 0, delim, 0, 1, x_max, True)
+        np.testing.assert_array_equal(stream[0], default[0])
+        np.testing.assert_array_equal(stream[1], default[1])
+        assert stream[2] == default[2]
+
+
+@pytest.fixture(scope="module")
+def fig_example():
+    return load_example("fig.py", "example_fig")
+
+
+@pytest.mark.parametrize("bins", [7, 30, 200])
+def test_hist_kernel_matches_numpy_on_edges(fig_example, monkeypatch, bins):
+    """Test the Numba histogram bins edge-aligned values like np.histogram."""
+    if fig_example.numba is None:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(fig_example, "HIST_KERNEL_MIN", 0)
+    # TBB's pool hangs at exit once later tests fork process pools.
+    monkeypatch.setattr(fig_example.numba.config, "THREADING_LAYER", "workqueue")
+    # Values quantized to 0.01 put many samples exactly on bin edges.
+    x = np.random.default_rng(0).uniform(-1, 1, 200_000).round(2)
+    counts, edges = fig_example._histogram(x, bins)
+    expected, expected_edges = np.histogram(x, bins=bins)
+    np.testing.assert_array_equal(counts, expected)
+    np.testing.assert_allclose(edges, expected_edges)
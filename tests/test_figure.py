@@ -6,7 +6,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from paperfig.figure import Fig, FigError
+from paperfig.figure import Fig, FigError, _append_pdf_pages
 
 
 @pytest.fixture
@@ -88,6 +88,17 @@ def test_validate_multi_constraints(tmp_path):
         Fig(p2)
 
 
+def test_fig_dir_setter(fig_instance, tmp_path):
+    """Test fig_dir accepts str/Path and expands a leading '~'."""
+    fig_instance.fig_dir = "out"
+    assert fig_instance.fig_dir == Path("out")
+    plain = tmp_path / "plain"
+    fig_instance.fig_dir = plain
+    assert fig_instance.fig_dir is plain
+    fig_instance.fig_dir = Path("~/figs")
+    assert fig_instance.fig_dir == Path.home() / "figs"
+
+
 def test_register_and_resolve_renderer(fig_instance):
     """Test registering a custom renderer and resolving it."""
     def dummy_renderer(idx, data, v):
@@ -116,9 +127,13 @@ def test_resolve_renderer_dynamic_import(fig_instance):
         mock_import.assert_called_with("my_module")
         assert resolved == mock_func
 
+        # Repeated lookups are served from the per-instance cache.
+        assert fig_instance._resolve_renderer("my_module:my_func") is resolved
+        assert mock_import.call_count == 1
 
-@patch("paperfig.figure.concat_pdf_pages")
-def test_create_pdf_simple(mock_concat, fig_instance):
+
+@patch("paperfig.figure._append_pdf_pages")
+def test_create_pdf_simple(mock_append, fig_instance):
     """Test creating PDFs for simple figures (no multi)."""
     # Create a simplified JSON for this test
     p = fig_instance.json_filename
@@ -136,9 +151,9 @@ def test_create_pdf_simple(mock_concat, fig_instance):
     fig_instance.register("simple", simple_renderer)
     
     # Ensure the final concatenated file is created by the mock
-    def side_effect_concat(input_files, output_file, col, row):
+    def side_effect_append(input_files, output_file):
         Path(output_file).touch()
-    mock_concat.side_effect = side_effect_concat
+    mock_append.side_effect = side_effect_append
 
     # Execute
     fig_instance.create_pdf()
@@ -147,15 +162,16 @@ def test_create_pdf_simple(mock_concat, fig_instance):
     assert (fig_instance.fig_dir / "fig1.pdf").exists()
     assert fig_instance.result["1"] == "result_data"
     
-    # Verify concatenation was called
+    # Verify the final 1x1 concatenation appends pages directly
     expected_out = str(fig_instance.fig_dir / "figures.pdf")
-    mock_concat.assert_called_once()
-    args, kwargs = mock_concat.call_args
-    assert kwargs["output_file"] == expected_out
+    mock_append.assert_called_once()
+    args, kwargs = mock_append.call_args
+    assert args[1] == expected_out
 
 
+@patch("paperfig.figure._append_pdf_pages")
 @patch("paperfig.figure.concat_pdf_pages")
-def test_create_pdf_multi(mock_concat, fig_instance):
+def test_create_pdf_multi(mock_concat, mock_append, fig_instance):
     """Test recursively creating PDFs for multi-layout figures."""
     # The fixture already has a multi setup at key "2" with children "2a", "2b"
     
@@ -172,6 +188,7 @@ def test_create_pdf_multi(mock_concat, fig_instance):
         Path(output_file).touch()
     
     mock_concat.side_effect = side_effect_concat
+    mock_append.side_effect = lambda input_files, output_file: Path(output_file).touch()
     
     # Execute
     fig_instance.create_pdf()
@@ -200,6 +217,24 @@ def test_renderer_output_missing(fig_instance):
         fig_instance.create_pdf()
 
 
+def test_render_log_follows_execution(fig_instance, caplog):
+    """Test serial runs log each figure only when its renderer starts."""
+    p = fig_instance.json_filename
+    p.write_text(json.dumps({"1": {"type": "fail"}, "2": {"type": "fail"}}),
+                 encoding="utf-8")
+    fig_instance.load_json()
+
+    def failing_renderer(idx, data, verbose):
+        raise RuntimeError(f"boom {idx}")
+
+    fig_instance.register("fail", failing_renderer)
+    with caplog.at_level("INFO", logger="paperfig.figure.Fig"):
+        with pytest.raises(RuntimeError, match="boom 1"):
+            fig_instance.create_pdf()
+    assert "Rendering 1 (type=fail)" in caplog.text
+    assert "Rendering 2" not in caplog.text
+
+
 def test_save_json(fig_instance):
     """Test saving the JSON spec back to disk."""
     fig_instance.list["1"]["title"] = "Modified Title"
@@ -208,3 +243,130 @@ def test_save_json(fig_instance):
     with open(fig_instance.json_filename, "r") as f:
         data = json.load(f)
     assert data["1"]["title"] == "Modified Title"
+
+
+def touch_renderer(idx, data, verbose):
+    """Module-level (picklable) renderer used by the parallel tests."""
+    Path(data["out"], f"fig{idx}.pdf").touch()
+    return f"result_{idx}"
+
+
+@patch("paperfig.figure._append_pdf_pages")
+@patch("paperfig.figure.concat_pdf_pages")
+def test_create_pdf_parallel(mock_concat, mock_append, fig_instance, caplog):
+    """Test rendering with a process pool keeps results and page order."""
+    out = str(fig_instance.fig_dir)
+    spec = {
+        "1": {"type": "touch", "out": out},
+        "2": {
+            "type": "multi", "row": 1, "column": 2,
+            "figures": {
+                "2a": {"type": "touch", "out": out},
+                "2b": {"type": "local", "out": out},
+            },
+        },
+        "3": {"type": "touch", "out": out},
+    }
+    fig_instance.json_filename.write_text(json.dumps(spec), encoding="utf-8")
+    fig_instance.load_json()
+    fig_instance.register("touch", touch_renderer)
+    # A lambda cannot be pickled, so it must be rendered in-process.
+    fig_instance.register(
+        "local", lambda idx, data, verbose: touch_renderer(idx, data, verbose))
+    fig_instance.jobs = 2
+
+    def side_effect_concat(input_files, output_file, col, row):
+        Path(output_file).touch()
+    mock_concat.side_effect = side_effect_concat
+    mock_append.side_effect = lambda input_files, output_file: Path(output_file).touch()
+
+    with caplog.at_level("INFO", logger="paperfig.figure.Fig"):
+        fig_instance.create_pdf()
+
+    assert fig_instance.result == {
+        "1": "result_1", "2a": "result_2a", "2b": "result_2b", "3": "result_3"}
+    # Pool jobs are logged once a worker has finished them.
+    assert "Rendered 1 (type=touch)" in caplog.text
+    assert "Rendered sub-figure 2a (type=touch) of 2" in caplog.text
+    assert "Rendering sub-figure 2b (type=local) of 2" in caplog.text
+    final_inputs = mock_append.call_args.args[0]
+    assert [Path(p).name for p in final_inputs] == [
+        "fig1.pdf", "fig2.pdf", "fig3.pdf"]
+
+
+def test_save_json_not_serializable(fig_instance):
+    """Test that non-serializable content raises FigError and keeps the file."""
+    before = fig_instance.json_filename.read_text(encoding="utf-8")
+    fig_instance.list["1"]["title"] = object()
+    with pytest.raises(FigError, match="Failed to convert JSON"):
+        fig_instance.save_json()
+    assert fig_instance.json_filename.read_text(encoding="utf-8") == before
+
+
+def test_append_pdf_pages(tmp_path):
+    """Test the 1x1 concatenation keeps the first page of each input."""
+    from pypdf import PdfReader, PdfWriter
+
+    inputs = []
+    for i, (w, h) in enumerate([(100, 200), (300, 400)]):
+        writer = PdfWriter()
+        writer.add_blank_page(width=w, height=h)
+        writer.add_blank_page(width=10, height=10)  # ignored, like pdfgridcat
+        path = tmp_path / f"in{i}.pdf"
+        with open(path, "wb") as f:
+            writer.write(f)
+        inputs.append(str(path))
+
+    out = tmp_path / "nested" / "out.pdf"  # parent is created like pdfgridcat
+    _append_pdf_pages(inputs, str(out))
+
+    pages = PdfReader(str(out)).pages
+    assert [(p.mediabox.width, p.mediabox.height) for p in pages] == [
+        (100, 200), (300, 400)]
+
+
+def test_json_nonfinite_roundtrip(tmp_path):
+    """Test NaN/Infinity literals load and survive save_json unchanged."""
+    p = tmp_path / "nan.json"
+    p.write_text('{"1": {"type": "t", "lo": NaN, "hi": Infinity}}',
+                 encoding="utf-8")
+    fig = Fig(p)
+    fig.save_json()
+    data = json.loads(p.read_text(encoding="utf-8"))
+    assert data["1"]["lo"] != data["1"]["lo"]  # NaN
+    assert data["1"]["hi"] == float("inf")
+
+
+def test_json_wide_int_roundtrip(tmp_path):
+    """Test integers beyond 64 bits load exactly and can be saved."""
+    seed = 123456789012345678901234567890
+    p = tmp_path / "seed.json"
+    p.write_text(json.dumps({"1": {"type": "sine", "seed": seed}}),
+                 encoding="utf-8")
+    fig = Fig(p)
+    assert fig.list["1"]["seed"] == seed
+    assert type(fig.list["1"]["seed"]) is int
+
+    fig.list["1"]["seed"] = 2 ** 70
+    fig.save_json()
+    assert json.loads(p.read_text(encoding="utf-8"))["1"]["seed"] == 2 ** 70
+
+
+def test_create_pdf_nested_pdf_filename(fig_instance):
+    """Test a pdf_filename with a subdirectory is created under fig_dir."""
+    from pypdf import PdfWriter
+
+    p = fig_instance.json_filename
+    p.write_text(json.dumps({"1": {"type": "blank"}}), encoding="utf-8")
+    fig_instance.load_json()
+
+    def blank_renderer(idx, data, verbose):
+        writer = PdfWriter()
+        writer.add_blank_page(width=72, height=72)
+        with open(fig_instance.fig_dir / f"fig{idx}.pdf", "wb") as f:
+            writer.write(f)
+
+    fig_instance.register("blank", blank_renderer)
+    fig_instance.pdf_filename = "sub/final.pdf"
+    fig_instance.create_pdf()
+    assert (fig_instance.fig_dir / "sub" / "final.pdf").exists()